@@ -0,0 +1,15 @@
+"""Installed version lookup for multiclaude."""
+
+import functools
+
+
+@functools.cache
+def get_version() -> str:
+    """Get the multiclaude version."""
+    # importlib.metadata is slow to import; only pay for it when asked
+    import importlib.metadata  # noqa: PLC0415
+
+    try:
+        return importlib.metadata.version("multiclaude")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
@@ -2,16 +2,17 @@
 """Multiclaude - CLI tool for managing parallel Claude Code instances with git worktrees."""
 
 import argparse
-import importlib.metadata
 import json
 import os
-import shutil
 import sys
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, NoReturn
 
+from ._version import get_version
 from .config import (
     Config,
     config_exists,
@@ -21,22 +22,26 @@ from .config import (
     set_config_value,
 )
 from .errors import MultiClaudeError, NotInitializedError
-from .git_utils import branch_exists, get_git_root, ref_exists
-from .strategies import get_strategy
+from .git_utils import check_new_branch, fetch_all_safe, get_git_root
 from .tasks import (
     Task,
     create_task,
     evaluate_prune_candidate,
     find_task_by_selector,
+    index_tasks,
     initialize_tasks,
     load_tasks,
+    mark_tasks_pruned,
+    match_tasks,
     normalize_task_selectors,
-    save_tasks,
 )
 
 # Type alias for command arguments that can be either argparse.Namespace or SimpleNamespace
 Args = argparse.Namespace | SimpleNamespace
 
+# Upper bound on concurrent prune evaluations (each runs several git commands)
+MAX_PRUNE_WORKERS = 16
+
 
 def exit_with_error(msg: str) -> NoReturn:
     """Print error message and exit."""
@@ -49,13 +54,23 @@ def print_success(msg: str) -> None:
     print(f"✓ {msg}")
 
 
-def get_version() -> str:
-    """Get the multiclaude version."""
+class _VersionAction(argparse.Action):
+    """Print the version and exit, looking it up only when the flag is used."""
 
-    try:
-        return importlib.metadata.version("multiclaude")
-    except importlib.metadata.PackageNotFoundError:
-        return "unknown"
+    def __init__(self, option_strings: Sequence[str], dest: str, **kwargs: Any):
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, **kwargs)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,  # noqa: ARG002
+        values: str | Sequence[Any] | None,  # noqa: ARG002
+        option_string: str | None = None,  # noqa: ARG002
+    ) -> NoReturn:
+        # Like argparse's own version action, print to stdout rather than stderr
+        sys.stdout.write(f"multiclaude {get_version()}\n")
+        parser.exit()
 
 
 def validate_config() -> Config:
@@ -92,6 +107,10 @@ def cmd_init(args: Args) -> None:
 
 def cmd_new(args: Args) -> None:
     """Create new task with isolated environment and launch Claude."""
+    # Only commands that touch environments pay for these imports
+    import shutil  # noqa: PLC0415
+
+    from .strategies import get_strategy  # noqa: PLC0415
 
     config = validate_config()
     strategy = get_strategy(config)
@@ -110,11 +129,12 @@ def cmd_new(args: Args) -> None:
 
     branch_name = f"mc-{args.branch_name}"
 
-    if branch_exists(config.repo_root, branch_name):
+    # Check branch and base ref together to avoid spawning git twice
+    branch_taken, base_exists = check_new_branch(config.repo_root, branch_name, args.base)
+    if branch_taken:
         exit_with_error(f"Branch '{branch_name}' already exists.")
 
-    # Validate base ref exists
-    if not ref_exists(config.repo_root, args.base):
+    if not base_exists:
         exit_with_error(f"Base ref '{args.base}' does not exist.")
 
     print(
@@ -146,6 +166,46 @@ def cmd_new(args: Args) -> None:
         print(f"To start working, run: cd {environment_path}")
 
 
+def _write_lines(lines: list[str]) -> None:
+    """Write lines to stdout with a single write call."""
+    if lines:
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+def _format_age(age: timedelta) -> str:
+    """Format an age as a short relative string (e.g. '3d ago')."""
+    if age.days > 0:
+        return f"{age.days}d ago"
+    if age.seconds > 3600:
+        return f"{age.seconds // 3600}h ago"
+    return f"{age.seconds // 60}m ago"
+
+
+def _existing_paths(paths: list[Path]) -> set[Path]:
+    """Return the subset of paths that exist, reading each parent directory once."""
+    listings: dict[Path, set[str] | None] = {}
+    existing: set[Path] = set()
+
+    for path in paths:
+        parent = path.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                listings[parent] = set()
+            except OSError:
+                # Unlistable parent (e.g. permissions); stat paths individually
+                listings[parent] = None
+
+        names = listings[parent]
+        exists = path.exists() if names is None else path.name in names
+        if exists:
+            existing.add(path)
+
+    return existing
+
+
 def cmd_list(args: Args) -> None:
     """List all multiclaude tasks."""
 
@@ -164,52 +224,51 @@ def cmd_list(args: Args) -> None:
     for task in tasks:
         if task.status == "pruned" or task.pruned_at is not None:
             pruned_tasks.append(task)
-            continue
-
-        environment_exists = Path(task.environment_path).expanduser().exists()
+        else:
+            active_tasks.append(task)
 
-        if not environment_exists:
-            task.status = "missing"
-        active_tasks.append(task)
+    # Build the whole listing and write it once rather than a print per task
+    lines: list[str] = []
 
     if args.quiet:
-        for task in active_tasks:
-            print(task.branch)
+        lines.extend(task.branch for task in active_tasks)
         if args.show_pruned:
-            for task in pruned_tasks:
-                print(task.branch)
+            lines.extend(task.branch for task in pruned_tasks)
+        _write_lines(lines)
         return
 
-    if active_tasks:
-        print("Active multiclaude tasks:")
-        for task in active_tasks:
-            created = datetime.fromisoformat(task.created_at)
-            age = datetime.now() - created
-            if age.days > 0:
-                age_str = f"{age.days}d ago"
-            elif age.seconds > 3600:
-                age_str = f"{age.seconds // 3600}h ago"
-            else:
-                age_str = f"{age.seconds // 60}m ago"
+    # Quiet output never shows status, so only check environments here
+    env_paths = [Path(task.environment_path).expanduser() for task in active_tasks]
+    existing_paths = _existing_paths(env_paths)
+
+    now = datetime.now()
 
-            status = "" if task.status == "active" else f" [{task.status}]"
+    if active_tasks:
+        lines.append("Active multiclaude tasks:")
+        for task, env_path in zip(active_tasks, env_paths, strict=True):
+            age_str = _format_age(now - datetime.fromisoformat(task.created_at))
+            task_status = task.status if env_path in existing_paths else "missing"
+            status = "" if task_status == "active" else f" [{task_status}]"
             agent_info = f" agent={task.agent}" if task.agent else ""
-            print(
+            lines.append(
                 f"  - {task.branch}: branch {task.branch} (created {age_str}){status}{agent_info}"
             )
 
     if pruned_tasks and args.show_pruned:
-        print("\nPruned tasks (metadata retained):")
+        lines.append("\nPruned tasks (metadata retained):")
         for task in pruned_tasks:
-            pruned = datetime.fromisoformat(task.pruned_at or task.created_at)
-            age = datetime.now() - pruned
-            age_str = f"{age.days}d ago" if age.days > 0 else f"{age.seconds // 3600}h ago"
+            age_str = _format_age(now - datetime.fromisoformat(task.pruned_at or task.created_at))
             agent_info = f" agent={task.agent}" if task.agent else ""
-            print(f"  - {task.branch}: branch {task.branch} (pruned {age_str}){agent_info}")
+            lines.append(f"  - {task.branch}: branch {task.branch} (pruned {age_str}){agent_info}")
+
+    _write_lines(lines)
 
 
 def cmd_prune(args: Args) -> None:
     """Prune completed or stale multiclaude environments."""
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    from .strategies import get_strategy  # noqa: PLC0415
 
     config = validate_config()
 
@@ -223,9 +282,7 @@ def cmd_prune(args: Args) -> None:
 
     if args.task_name:
         selectors = normalize_task_selectors(args.task_name)
-        tasks_to_consider = [
-            task for task in tasks if task.branch in selectors or task.id in selectors
-        ]
+        tasks_to_consider = match_tasks(tasks, index_tasks(tasks), selectors)
         if not tasks_to_consider:
             exit_with_error(f"No task found matching '{args.task_name}'.")
     else:
@@ -233,30 +290,51 @@ def cmd_prune(args: Args) -> None:
 
     prune_candidates: list[tuple[Task, dict[str, Any]]] = []
 
-    for task in tasks_to_consider:
-        if task.status == "pruned":
-            print(f"Skipping {task.branch}: already pruned")
-            continue
+    # Each evaluation is a handful of git subprocesses in its own environment, so
+    # run them concurrently and consume the results in task order.
+    to_evaluate = [task for task in tasks_to_consider if task.status != "pruned"]
 
-        evaluation = evaluate_prune_candidate(task, default_branch, args.force)
+    # Worktrees share the main repo's refs, so one fetch there covers every task.
+    # Clones have their own object databases and still fetch individually.
+    shared_fetch = strategy.name == "worktree"
+    if shared_fetch and to_evaluate and not args.force and not fetch_all_safe(config.repo_root):
+        print("Warning: git fetch --all failed; remote branch state may be stale")
 
-        for warning in evaluation.get("warnings", []):
-            print(f"Warning for {task.branch}: {warning}")
+    if args.dry_run:
+        print("Dry run mode enabled. No changes will be made.")
 
-        if evaluation["prune"]:
-            prune_candidates.append((task, evaluation))
-        else:
-            print(f"Skipping {task.branch}: {evaluation['reason']}")
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_PRUNE_WORKERS, len(to_evaluate)))) as pool:
+        evaluations = pool.map(
+            evaluate_prune_candidate,
+            to_evaluate,
+            repeat(default_branch),
+            repeat(args.force),
+            repeat(not shared_fetch),
+        )
+
+        for task in tasks_to_consider:
+            if task.status == "pruned":
+                print(f"Skipping {task.branch}: already pruned")
+                continue
+
+            evaluation = next(evaluations)
+
+            for warning in evaluation.get("warnings", []):
+                print(f"Warning for {task.branch}: {warning}")
+
+            if evaluation["prune"]:
+                prune_candidates.append((task, evaluation))
+                # Report dry-run results as they arrive instead of after every evaluation
+                if args.dry_run:
+                    print(f"Dry run: would prune {task.branch} ({evaluation.get('reason', '')}).")
+            else:
+                print(f"Skipping {task.branch}: {evaluation['reason']}")
 
     if not prune_candidates:
         print("No tasks eligible for pruning.")
         return
 
     if args.dry_run:
-        print("Dry run mode enabled. No changes will be made.")
-        for task, evaluation in prune_candidates:
-            reason = evaluation.get("reason", "")
-            print(f"Dry run: would prune {task.branch} ({reason}).")
         return
 
     if not args.yes:
@@ -270,7 +348,9 @@ def cmd_prune(args: Args) -> None:
             print("Prune cancelled.")
             return
 
-    pruned_any = False
+    pruned_ids: set[str] = set()
+    # Everything pruned in one run shares a single timestamp
+    pruned_at = datetime.now().isoformat()
 
     for task, evaluation in prune_candidates:
         env_path = Path(task.environment_path).expanduser()
@@ -292,12 +372,10 @@ def cmd_prune(args: Args) -> None:
             else:
                 print(f"Pruned task {task.branch}: {reason}")
 
-        pruned_any = True
-        task.status = "pruned"
-        task.pruned_at = datetime.now().isoformat()
+        pruned_ids.add(task.id)
 
-    if pruned_any:
-        save_tasks(config, tasks)
+    if pruned_ids:
+        mark_tasks_pruned(config, pruned_ids, pruned_at)
 
 
 def cmd_config(args: Args) -> None:
@@ -389,7 +467,7 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Multiclaude - Manage parallel Claude Code instances with isolated environments"
     )
-    parser.add_argument("--version", action="version", version=f"multiclaude {get_version()}")
+    parser.add_argument("--version", action=_VersionAction)
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # init command
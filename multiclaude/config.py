@@ -1,12 +1,15 @@
 """Configuration management for multiclaude."""
 
-import json
+import functools
 from dataclasses import asdict, dataclass, fields, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import json_utils
+from ._version import get_version
 from .errors import MultiClaudeError, NotInitializedError
+from .fs_utils import atomic_write_bytes
 from .git_utils import get_default_branch
 
 DEFAULT_AGENT = "claude"
@@ -81,10 +84,14 @@ def config_exists(repo_root: Path) -> bool:
 def _update_git_exclude(repo_root: Path) -> None:
     """Add .multiclaude to git exclude file."""
     exclude_file = repo_root / ".git" / "info" / "exclude"
-    if exclude_file.exists():
-        content = exclude_file.read_text()
-        if ".multiclaude" not in content:
-            exclude_file.write_text(content + "\n.multiclaude\n")
+    try:
+        with exclude_file.open("r+b") as f:
+            # Reading leaves the file position at the end, ready to append
+            if b".multiclaude" not in f.read():
+                f.write(b"\n.multiclaude\n")
+    except (FileNotFoundError, NotADirectoryError):
+        # No exclude file, or .git is a pointer file (linked worktree, submodule)
+        pass
 
 
 def _validate_field(field: str, value: Any) -> Any:
@@ -112,8 +119,6 @@ def _validate_field(field: str, value: Any) -> Any:
 
 def initialize_config(repo_root: Path, environments_dir: Path | None = None) -> Config:
     """Initialize multiclaude configuration."""
-    from .cli import get_version  # noqa: PLC0415
-
     (repo_root / ".multiclaude").mkdir(exist_ok=True)
 
     config = Config(
@@ -134,16 +139,34 @@ def initialize_config(repo_root: Path, environments_dir: Path | None = None) ->
 
 def save_config(repo_root: Path, config: Config) -> None:
     """Save Config to file."""
-    _get_config_file(repo_root).write_text(json.dumps(config.to_dict(), indent=2))
+    atomic_write_bytes(_get_config_file(repo_root), json_utils.dumps(config.to_dict()))
+    _read_config_data.cache_clear()
+
+
+@functools.cache
+def _read_config_data(
+    config_file: Path,
+    mtime_ns: int,  # noqa: ARG001 - part of the cache key
+    size: int,  # noqa: ARG001 - part of the cache key
+) -> dict[str, Any]:
+    """Parse config file contents, memoized on the file's stat signature."""
+    data: dict[str, Any] = json_utils.loads(config_file.read_bytes())
+    return data
 
 
 def load_config(repo_root: Path) -> Config:
     """Load configuration for the current repository."""
-    if not config_exists(repo_root):
-        raise NotInitializedError("Multiclaude not initialized. Run 'multiclaude init' first.")
-
-    data = json.loads(_get_config_file(repo_root).read_text())
-    return Config.from_dict(data)
+    config_file = _get_config_file(repo_root)
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
+        raise NotInitializedError(
+            "Multiclaude not initialized. Run 'multiclaude init' first."
+        ) from None
+
+    # from_dict mutates its argument, so hand it a copy of the cached data
+    data = _read_config_data(config_file, stat.st_mtime_ns, stat.st_size)
+    return Config.from_dict(dict(data))
 
 
 def get_config_value(config: Config, field: str) -> Any:
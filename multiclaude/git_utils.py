@@ -1,21 +1,113 @@
 """Git utility functions for multiclaude."""
 
+import os
 import subprocess
 from pathlib import Path
 
+# (returncode, stdout, stderr) as returned by git()
+GitResult = tuple[int, str, str]
 
-def git(cmd: list[str], cwd: Path, check: bool = False) -> tuple[int, str, str]:
+
+def git(
+    cmd: list[str], cwd: Path, check: bool = False, env: dict[str, str] | None = None
+) -> GitResult:
     """Run a git command and return (returncode, stdout, stderr)."""
-    proc = subprocess.run(["git", *cmd], capture_output=True, text=True, check=check, cwd=cwd)  # noqa: S603, S607
+    proc = subprocess.run(  # noqa: S603
+        ["git", *cmd],  # noqa: S607
+        capture_output=True,
+        text=True,
+        check=check,
+        cwd=cwd,
+        env=env,
+    )
     return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
 
 
+def git_bytes(cmd: list[str], cwd: Path) -> tuple[int, bytes]:
+    """Run a git command and return (returncode, raw stdout), discarding stderr.
+
+    Skips text decoding for callers that only need a few bytes of output.
+    """
+    proc = subprocess.run(  # noqa: S603
+        ["git", *cmd],  # noqa: S607
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        cwd=cwd,
+    )
+    return proc.returncode, proc.stdout
+
+
+def git_quiet(cmd: list[str], cwd: Path) -> int:
+    """Run a git command for its exit code only, discarding all output.
+
+    Output never reaches Python, so nothing is buffered or decoded.
+    """
+    return subprocess.run(  # noqa: S603
+        ["git", *cmd],  # noqa: S607
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        cwd=cwd,
+    ).returncode
+
+
+# Environment variables that change how git discovers the repository
+_GIT_DISCOVERY_ENV = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+)
+
+
+def _find_git_root(start: Path) -> Path | None:
+    """Find the enclosing work tree by looking for a .git entry, without spawning git.
+
+    Returns None whenever git's own discovery could disagree (discovery env vars,
+    running inside a .git directory, crossing a filesystem boundary, a repository
+    owned by another user that safe.directory may reject); the caller should then
+    ask git.
+    """
+    if any(var in os.environ for var in _GIT_DISCOVERY_ENV):
+        return None
+    try:
+        start = start.resolve(strict=True)
+        device = start.stat().st_dev
+        for path in (start, *start.parents):
+            if path.name == ".git" or path.stat().st_dev != device:
+                return None
+            dot_git = path / ".git"
+            if (dot_git / "HEAD").is_file():
+                found = True
+            elif dot_git.is_file():
+                # Linked worktrees and submodules use a "gitdir: <path>" file
+                with dot_git.open("rb") as f:
+                    found = f.read(8) == b"gitdir: "
+            else:
+                continue
+            return path if found and _owned_by_current_user(path, dot_git) else None
+    except OSError:
+        return None
+    return None
+
+
+def _owned_by_current_user(*paths: Path) -> bool:
+    """Check the ownership git's safe.directory protection compares against."""
+    uid = os.getuid()
+    return all(path.stat().st_uid == uid for path in paths)
+
+
 def get_git_root(cwd: Path | None = None) -> Path | None:
     """Get the root of the git repository containing the current or given directory.
 
     Returns None if not in a git repository.
     """
     working_dir = cwd or Path.cwd()
+    root = _find_git_root(working_dir)
+    if root is not None:
+        return root
+
     code, stdout, _ = git(["rev-parse", "--show-toplevel"], working_dir)
     if code == 0 and stdout:
         return Path(stdout)
@@ -27,30 +119,124 @@ def get_repo_name(repo_root: Path) -> str:
     return repo_root.name
 
 
+class GitBatch:
+    """Long-running `git cat-file --batch-check` process for cheap existence checks.
+
+    Each query is one line over a pipe instead of a fresh git process. Use as a
+    context manager so the process is shut down when done.
+    """
+
+    def __init__(self, repo_root: Path):
+        """Initialize the batch helper for a repository."""
+        self.repo_root = repo_root
+        self._proc: subprocess.Popen[str] | None = None
+
+    def __enter__(self) -> "GitBatch":
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],  # noqa: S607
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd=self.repo_root,
+        )
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the underlying git process."""
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        if proc.stdin:
+            proc.stdin.close()
+        if proc.stdout:
+            proc.stdout.close()
+        proc.wait()
+
+    def exists(self, rev: str) -> bool:
+        """Check if a revision (ref, tag, commit, ...) resolves to an object."""
+        if self._proc is None or self._proc.stdin is None or self._proc.stdout is None:
+            raise RuntimeError("GitBatch used outside of a 'with' block")
+        if not rev or "\n" in rev:
+            return False
+        try:
+            self._proc.stdin.write(f"{rev}\n")
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+        except OSError:
+            return False
+        # Resolved objects print "<sha> <type>", failures "<rev> missing|ambiguous"
+        _, _, object_type = line.rstrip("\n").rpartition(" ")
+        return object_type in {"commit", "tag", "tree", "blob"}
+
+    def branch_exists(self, branch_name: str) -> bool:
+        """Check if a local branch exists."""
+        return self.exists(f"refs/heads/{branch_name}")
+
+
 def branch_exists(repo_root: Path, branch_name: str) -> bool:
     """Check if branch already exists."""
-    code, stdout, _ = git(["branch", "--list", branch_name], repo_root)
-    return code == 0 and bool(stdout.strip())
+    with GitBatch(repo_root) as batch:
+        return batch.branch_exists(branch_name)
 
 
 def ref_exists(repo_root: Path, ref: str) -> bool:
     """Check if a git ref (branch/tag/commit) exists."""
-    code, _, _ = git(["rev-parse", "--verify", ref], repo_root)
-    return code == 0
+    with GitBatch(repo_root) as batch:
+        return batch.exists(ref)
+
+
+def check_new_branch(repo_root: Path, branch_name: str, base_ref: str) -> tuple[bool, bool]:
+    """Check branch and base ref existence with a single git process.
+
+    Returns (branch_exists, base_exists).
+    """
+    with GitBatch(repo_root) as batch:
+        return batch.branch_exists(branch_name), batch.exists(base_ref)
 
 
 def get_origin_remote(repo_root: Path) -> str | None:
     """Get the URL of the origin remote if it exists."""
-    code, stdout, _ = git(["remote", "get-url", "origin"], repo_root)
-    return stdout if code == 0 else None
+    code, stdout = git_bytes(["remote", "get-url", "origin"], repo_root)
+    url = stdout.strip()
+    return url.decode() if code == 0 and url else None
+
+
+def _read_origin_head(repo_root: Path) -> bytes | None:
+    """Read the loose refs/remotes/origin/HEAD symref without spawning git.
+
+    Returns the target ref, or None if it can't be read directly (e.g. the
+    repository uses a different ref storage layout).
+    """
+    git_dir = repo_root / ".git"
+    try:
+        if git_dir.is_file():
+            # Worktrees and submodules: ".git" is a "gitdir: <path>" pointer file
+            content = git_dir.read_bytes().strip()
+            if not content.startswith(b"gitdir: "):
+                return None
+            git_dir = (repo_root / content[8:].decode()).resolve()
+        commondir = git_dir / "commondir"
+        if commondir.is_file():
+            git_dir = (git_dir / commondir.read_bytes().strip().decode()).resolve()
+        head = (git_dir / "refs" / "remotes" / "origin" / "HEAD").read_bytes().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return head[5:] if head.startswith(b"ref: ") else None
 
 
 def get_default_branch(repo_root: Path) -> str:
     """Get the default branch name."""
-    code, stdout, _ = git(["symbolic-ref", "refs/remotes/origin/HEAD"], repo_root)
-    if code == 0 and stdout:
+    ref = _read_origin_head(repo_root)
+    if ref is None:
+        code, stdout = git_bytes(["symbolic-ref", "refs/remotes/origin/HEAD"], repo_root)
+        ref = stdout.rstrip() if code == 0 else None
+    if ref:
         # refs/remotes/origin/main -> main
-        return stdout.split("/")[-1]
+        return ref.rsplit(b"/", 1)[-1].decode()
     return "main"
 
 
@@ -76,20 +262,31 @@ def configure_clone_remotes(clone_path: Path, base_repo_path: Path) -> tuple[boo
     return True, ""
 
 
-def check_git_status(repo_path: Path) -> tuple[bool, str | None]:
+def readonly_git_env() -> dict[str, str]:
+    """Environment for read-only git inspection.
+
+    GIT_OPTIONAL_LOCKS=0 makes git skip optional lock-taking writes such as the
+    index refresh done by `git status`.
+    """
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
+def check_git_status(repo_path: Path, env: dict[str, str] | None = None) -> tuple[bool, str | None]:
     """Check if working directory is clean. Returns (is_clean, error_msg)."""
-    code, stdout, stderr = git(["status", "--porcelain"], repo_path)
+    code, stdout, stderr = git(["status", "--porcelain"], repo_path, env=env)
     if code != 0:
         return False, f"failed to inspect git status: {stderr or stdout or 'unknown error'}"
     return not stdout, "uncommitted changes present" if stdout else None
 
 
-def check_unpushed_commits(repo_path: Path, branch: str) -> list[str]:
+def check_unpushed_commits(
+    repo_path: Path, branch: str, env: dict[str, str] | None = None
+) -> list[str]:
     """Check for unpushed commits. Returns list of issues."""
     issues = []
 
     # Check if origin exists
-    code, stdout, stderr = git(["remote"], repo_path)
+    code, stdout, stderr = git(["remote"], repo_path, env=env)
     if code != 0:
         return [f"failed to list git remotes: {stderr or stdout or 'unknown error'}"]
     if "origin" not in stdout.splitlines():
@@ -97,11 +294,13 @@ def check_unpushed_commits(repo_path: Path, branch: str) -> list[str]:
 
     # Check if remote branch exists and has unpushed commits
     remote_branch = f"origin/{branch}"
-    if git(["rev-parse", "--verify", remote_branch], repo_path)[0] != 0:
+    if git(["rev-parse", "--verify", remote_branch], repo_path, env=env)[0] != 0:
         issues.append(f"remote branch {remote_branch} not found (unpushed commits)")
     else:
-        # Check for unpushed commits
-        code, stdout, stderr = git(["log", f"{remote_branch}..HEAD"], repo_path)
+        # Only emptiness matters, so never ask for more than one commit
+        code, stdout, stderr = git(
+            ["log", "--oneline", "-n", "1", f"{remote_branch}..HEAD"], repo_path, env=env
+        )
         if code != 0:
             issues.append(
                 f"failed to compare with {remote_branch}: {stderr or stdout or 'unknown error'}"
@@ -112,17 +311,16 @@ def check_unpushed_commits(repo_path: Path, branch: str) -> list[str]:
     return issues
 
 
-def is_branch_merged(repo_path: Path, branch: str, target: str) -> tuple[bool, str | None]:
+def is_branch_merged(
+    repo_path: Path, branch: str, target: str, env: dict[str, str] | None = None
+) -> tuple[bool, str | None]:
     """Check if branch is merged into target. Returns (is_merged, error_msg)."""
-    code, stdout, stderr = git(["branch", "--merged", target], repo_path)
-    if code != 0:
-        return False, f"failed to check merge status: {stderr or stdout or 'unknown error'}"
-
-    merged_branches = {
-        line.strip().lstrip("*").strip() for line in stdout.splitlines() if line.strip()
-    }
-    is_merged = branch in merged_branches
-    return is_merged, None if is_merged else f"branch not merged into {target}"
+    code, stdout, stderr = git(["merge-base", "--is-ancestor", branch, target], repo_path, env=env)
+    if code == 0:
+        return True, None
+    if code == 1:
+        return False, f"branch not merged into {target}"
+    return False, f"failed to check merge status: {stderr or stdout or 'unknown error'}"
 
 
 def clean_working_tree(repo_path: Path) -> tuple[bool, str]:
@@ -143,8 +341,7 @@ def clean_working_tree(repo_path: Path) -> tuple[bool, str]:
 
 def fetch_all_safe(repo_path: Path) -> bool:
     """Fetch all remotes, returning True if successful."""
-    code, _, _ = git(["fetch", "--all"], repo_path)
-    return code == 0
+    return git_quiet(["fetch", "--all"], repo_path) == 0
 
 
 def checkout_branch(
@@ -0,0 +1,34 @@
+"""JSON helpers for multiclaude metadata files.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from raw file bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize to JSON bytes, indented unless pretty is False.
+
+    Compact output is byte-identical between orjson and the standard library.
+    """
+    if HAS_ORJSON:
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+        return data
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -1,5 +1,6 @@
 """Utilities for managing sandbox environments for testing."""
 
+import os
 import shutil
 from pathlib import Path
 
@@ -60,10 +61,10 @@ class SandboxManager:
 
     def get_worktree_count(self) -> int:
         """Get number of worktrees in sandbox."""
-        if not self.worktree_path.exists():
-            return 0
         # Count subdirectories in worktrees/<repo-name>/
         repo_worktree_dir = self.worktree_path / self.repo_path.name
-        if not repo_worktree_dir.exists():
+        try:
+            with os.scandir(repo_worktree_dir) as entries:
+                return sum(1 for _ in entries)
+        except FileNotFoundError:
             return 0
-        return len(list(repo_worktree_dir.iterdir()))
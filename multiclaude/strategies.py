@@ -1,6 +1,8 @@
 """Environment creation strategies for multiclaude."""
 
 import abc
+import errno
+import os
 import random
 import shutil
 import string
@@ -20,6 +22,9 @@ from .git_utils import (
     setup_branch_from_ref,
 )
 
+# Parallel submodule clones/fetches; they are network-bound, so this need not track CPU count
+SUBMODULE_JOBS = 8
+
 
 class EnvironmentStrategy(Protocol):
     """Interface for environment creation strategies."""
@@ -56,13 +61,17 @@ def generate_hash(length: int = 7) -> str:
 def find_available_environment(base_dir: Path, repo_name: str) -> Path | None:
     """Find an available environment (named avail-{hash}) for the given repo."""
     repo_dir = base_dir / repo_name
-    if not repo_dir.exists():
+    try:
+        entries = os.scandir(repo_dir)
+    except FileNotFoundError:
         return None
 
-    # Look for directories starting with "avail-"
-    for path in repo_dir.iterdir():
-        if path.is_dir() and path.name.startswith("avail-"):
-            return path
+    # Look for directories starting with "avail-"; checking the name first means
+    # is_dir() only runs for candidates, and scandir usually answers it without a stat
+    with entries:
+        for entry in entries:
+            if entry.name.startswith("avail-") and entry.is_dir(follow_symlinks=False):
+                return Path(entry.path)
 
     return None
 
@@ -76,17 +85,6 @@ def prepare_reused_environment(env_path: Path, base_ref: str, branch_name: str)
 
 def make_environment_available(env_path: Path) -> None:
     """Make an environment available for reuse by renaming to avail-*."""
-    # Generate unique available name
-    hash_suffix = generate_hash()
-    available_name = f"avail-{hash_suffix}"
-    available_path = env_path.parent / available_name
-
-    # Make sure we don't collide with existing names
-    while available_path.exists():
-        hash_suffix = generate_hash()
-        available_name = f"avail-{hash_suffix}"
-        available_path = env_path.parent / available_name
-
     # Clean up the git state before making it available
     success, error = clean_working_tree(env_path)
     if not success:
@@ -103,9 +101,19 @@ def make_environment_available(env_path: Path) -> None:
         shutil.rmtree(env_path)
         return
 
-    # Rename to make available
-    env_path.rename(available_path)
-    print(f"Environment renamed to {available_name} for reuse")
+    # Rename to make available. rename() refuses to replace a populated directory,
+    # so on a name collision just retry with a fresh hash; probing with exists()
+    # first would race with other processes recycling environments.
+    while True:
+        available_path = env_path.parent / f"avail-{generate_hash()}"
+        try:
+            env_path.rename(available_path)
+        except OSError as exc:
+            if exc.errno in {errno.EEXIST, errno.ENOTEMPTY}:
+                continue
+            raise
+        break
+    print(f"Environment renamed to {available_path.name} for reuse")
 
 
 class WorktreeStrategy(EnvironmentStrategy):
@@ -135,15 +143,19 @@ class WorktreeStrategy(EnvironmentStrategy):
         # Ensure the parent directory exists
         worktree_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if base_ref exists
-        if not ref_exists(repo_root, base_ref):
-            raise MultiClaudeError(f"Base ref '{base_ref}' does not exist")
-
-        # Create the worktree with the new branch from base_ref
+        # Create the worktree with the new branch from base_ref. git validates the
+        # branch and base ref itself, so map its errors instead of pre-checking;
+        # LC_ALL=C keeps those messages in English whatever the user's locale.
         code, _, stderr = git(
-            ["worktree", "add", str(worktree_path), "-b", branch_name, base_ref], repo_root
+            ["worktree", "add", str(worktree_path), "-b", branch_name, base_ref],
+            repo_root,
+            env={**os.environ, "LC_ALL": "C"},
         )
         if code != 0:
+            if f"a branch named '{branch_name}' already exists" in stderr:
+                raise MultiClaudeError(f"Branch '{branch_name}' already exists")
+            if "invalid reference" in stderr or "not a valid object name" in stderr:
+                raise MultiClaudeError(f"Base ref '{base_ref}' does not exist")
             raise MultiClaudeError(f"Failed to create worktree: {stderr}")
 
         return worktree_path, False
@@ -230,7 +242,18 @@ class CloneStrategy(EnvironmentStrategy):
                 raise MultiClaudeError(f"Failed to create branch: {error}")
 
         # Handle submodules (for both new and reused environments)
-        code, stdout, _ = git(["submodule", "update", "--init", "--recursive"], clone_path)
+        # submodule.fetchJobs (rather than --jobs) is silently ignored by old git versions
+        code, stdout, _ = git(
+            [
+                "-c",
+                f"submodule.fetchJobs={SUBMODULE_JOBS}",
+                "submodule",
+                "update",
+                "--init",
+                "--recursive",
+            ],
+            clone_path,
+        )
         if code == 0 and stdout:
             print("Initialized submodules")
 
@@ -1,16 +1,25 @@
-import json
-from dataclasses import asdict, dataclass
+import functools
+from collections.abc import Collection
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from .git_utils import check_git_status, check_unpushed_commits, git, is_branch_merged
+from . import json_utils
+from .fs_utils import atomic_write_bytes, file_lock
+from .git_utils import (
+    check_git_status,
+    check_unpushed_commits,
+    git_quiet,
+    is_branch_merged,
+    readonly_git_env,
+)
 
 if TYPE_CHECKING:
     from .config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a multiclaude task."""
 
@@ -22,6 +31,18 @@ class Task:
     agent: str
     pruned_at: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return {
+            "id": self.id,
+            "branch": self.branch,
+            "created_at": self.created_at,
+            "status": self.status,
+            "environment_path": self.environment_path,
+            "agent": self.agent,
+            "pruned_at": self.pruned_at,
+        }
+
 
 def _get_tasks_file(config: "Config") -> Path:
     """Get path to tasks file."""
@@ -30,23 +51,79 @@ def _get_tasks_file(config: "Config") -> Path:
 
 def initialize_tasks(config: "Config") -> None:
     """Initialize tasks file."""
-    tasks_file = _get_tasks_file(config)
-    tasks_file.write_text("[]")
+    _write_tasks(_get_tasks_file(config), [])
+
+
+@functools.lru_cache(maxsize=1)
+def _read_tasks_data(
+    tasks_file: Path,
+    mtime_ns: int,  # noqa: ARG001 - part of the cache key
+    size: int,  # noqa: ARG001 - part of the cache key
+) -> list[dict[str, Any]]:
+    """Parse tasks file contents, memoized on the file's stat signature."""
+    raw = tasks_file.read_bytes()
+    # Freshly initialized (or truncated) files need no parser
+    if raw.strip() in (b"[]", b""):
+        return []
+    data: list[dict[str, Any]] = json_utils.loads(raw)
+    return data
 
 
 def load_tasks(config: "Config") -> list[Task]:
     """Load all tasks."""
     tasks_file = _get_tasks_file(config)
-    if not tasks_file.exists():
+    try:
+        stat = tasks_file.stat()
+    except FileNotFoundError:
         return []
-    data = json.loads(tasks_file.read_text())
+    # Callers mutate the returned tasks, so always build fresh Task objects
+    data = _read_tasks_data(tasks_file, stat.st_mtime_ns, stat.st_size)
     return [Task(**task) for task in data]
 
 
+def _get_lock_file(config: "Config") -> Path:
+    """Get path to the lock file guarding tasks.json updates."""
+    return config.repo_root / ".multiclaude" / ".lock"
+
+
 def save_tasks(config: "Config", tasks: list[Task]) -> None:
     """Save tasks to file."""
-    tasks_file = _get_tasks_file(config)
-    tasks_file.write_text(json.dumps([asdict(t) for t in tasks], indent=2))
+    with file_lock(_get_lock_file(config)):
+        _write_tasks(_get_tasks_file(config), tasks)
+
+
+def mark_tasks_pruned(config: "Config", task_ids: Collection[str], pruned_at: str) -> None:
+    """Mark tasks as pruned, re-reading tasks.json under the lock.
+
+    Applying the update to the current file keeps tasks created concurrently
+    (e.g. by `multiclaude new` while a prune is running) instead of overwriting
+    them with a stale list.
+    """
+    with file_lock(_get_lock_file(config)):
+        # The stat-keyed cache could miss a same-size rewrite within the mtime granularity
+        _read_tasks_data.cache_clear()
+        tasks = load_tasks(config)
+        for task in tasks:
+            if task.id in task_ids and task.status != "pruned":
+                task.status = "pruned"
+                task.pruned_at = pruned_at
+        _write_tasks(_get_tasks_file(config), tasks)
+
+
+def _write_tasks(tasks_file: Path, tasks: list[Task]) -> None:
+    """Atomically replace tasks.json with the given tasks.
+
+    tasks.json is machine-managed, so it is written compactly; config.json stays indented.
+    Skips the write (and its fsync) when the file already holds exactly this content.
+    """
+    data = json_utils.dumps([t.to_dict() for t in tasks], pretty=False)
+    try:
+        if tasks_file.stat().st_size == len(data) and tasks_file.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(tasks_file, data)
+    _read_tasks_data.cache_clear()
 
 
 def create_task(
@@ -61,9 +138,13 @@ def create_task(
         environment_path=str(environment_path),
         agent=agent_name,
     )
-    tasks = load_tasks(config)
-    tasks.append(task)
-    save_tasks(config, tasks)
+    # Lock so concurrent `multiclaude new` runs cannot interleave their updates
+    with file_lock(_get_lock_file(config)):
+        # Re-read rather than trust a stat-keyed cache entry from before the lock
+        _read_tasks_data.cache_clear()
+        tasks = load_tasks(config)
+        tasks.append(task)
+        _write_tasks(_get_tasks_file(config), tasks)
     return task
 
 
@@ -78,8 +159,30 @@ def normalize_task_selectors(raw: str) -> set[str]:
     return selectors
 
 
-def evaluate_prune_candidate(task: Task, default_branch: str, force: bool) -> dict[str, Any]:
-    """Inspect a task/environment to determine prune safety."""
+def index_tasks(tasks: list[Task]) -> dict[str, list[int]]:
+    """Map each task branch and id to the positions of the tasks that have it."""
+    index: dict[str, list[int]] = {}
+    for position, task in enumerate(tasks):
+        index.setdefault(task.branch, []).append(position)
+        if task.id != task.branch:
+            index.setdefault(task.id, []).append(position)
+    return index
+
+
+def match_tasks(tasks: list[Task], index: dict[str, list[int]], selectors: set[str]) -> list[Task]:
+    """Return tasks matching any selector by branch or id, in stored order."""
+    positions = {position for selector in selectors for position in index.get(selector, [])}
+    return [tasks[position] for position in sorted(positions)]
+
+
+def evaluate_prune_candidate(
+    task: Task, default_branch: str, force: bool, fetch: bool = True
+) -> dict[str, Any]:
+    """Inspect a task/environment to determine prune safety.
+
+    Pass fetch=False when remote refs were already fetched into a shared object
+    database (e.g. the main repo of a worktree).
+    """
     env_path = Path(task.environment_path).expanduser()
 
     # Handle missing environment
@@ -100,22 +203,25 @@ def evaluate_prune_candidate(task: Task, default_branch: str, force: bool) -> di
     issues = []
     warnings: list[str] = []
 
+    # Inspection only, so don't let git status take the index lock to refresh it
+    env = readonly_git_env()
+
     # Check working directory
-    is_clean, msg = check_git_status(env_path)
+    is_clean, msg = check_git_status(env_path, env)
     if msg:
         issues.append(msg)
         if not is_clean and not force:
             return _prune_result(False, msg, issues, warnings)
 
     # Check unpushed commits
-    issues.extend(check_unpushed_commits(env_path, task.branch))
+    issues.extend(check_unpushed_commits(env_path, task.branch, env))
 
     # Fetch latest (non-blocking)
-    if git(["fetch", "origin", task.branch], env_path)[0] != 0:
+    if fetch and git_quiet(["fetch", "origin", task.branch], env_path) != 0:
         warnings.append(f"git fetch origin {task.branch} failed")
 
     # Check merge status
-    is_merged, msg = is_branch_merged(env_path, task.branch, default_branch)
+    is_merged, msg = is_branch_merged(env_path, task.branch, default_branch, env)
     if msg:
         issues.append(msg)
 
@@ -160,8 +266,8 @@ def find_task_by_selector(config: "Config", selector: str) -> Task:
     # Find matching tasks (exclude pruned)
     matches = [
         task
-        for task in tasks
-        if (task.branch in selectors or task.id in selectors) and task.status != "pruned"
+        for task in match_tasks(tasks, index_tasks(tasks), selectors)
+        if task.status != "pruned"
     ]
 
     if not matches:
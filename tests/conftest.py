@@ -27,6 +27,21 @@ def configure_git_repo(path: Path) -> None:
         git(["config", key, value], path, check=True)
 
 
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a configured repository on branch main with one empty commit.
+
+    Returns:
+        Path to the repository (the working directory is left unchanged)
+    """
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    git(["init", "-b", "main"], repo_path, check=True)
+    configure_git_repo(repo_path)
+    git(["commit", "--allow-empty", "-m", "init"], repo_path, check=True)
+    return repo_path
+
+
 @pytest.fixture
 def isolated_git_repo(tmp_path: Path, monkeypatch) -> Generator[Path, None, None]:
     """Create an isolated git repository for testing.
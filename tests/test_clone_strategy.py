@@ -2,9 +2,15 @@
 
 from pathlib import Path
 
+from multiclaude import strategies
 from multiclaude.config import Config
 from multiclaude.git_utils import git
-from multiclaude.strategies import CloneStrategy, find_available_environment, generate_hash
+from multiclaude.strategies import (
+    CloneStrategy,
+    find_available_environment,
+    generate_hash,
+    make_environment_available,
+)
 
 
 def create_mock_config(base_dir):
@@ -164,3 +170,25 @@ def test_clone_strategy_remove_creates_available_environment(isolated_git_repo,
     )
     assert code == 0
     assert stdout == ""
+
+
+def test_make_environment_available_retries_on_name_collision(tmp_path, monkeypatch):
+    """Test that a taken avail-* name is skipped instead of overwritten."""
+    env_path = tmp_path / "mc-done"
+    env_path.mkdir()
+    (env_path / "work.txt").write_text("work")
+    taken = tmp_path / "avail-aaaaaaa"
+    taken.mkdir()
+    (taken / "other.txt").write_text("other")
+
+    monkeypatch.setattr(strategies, "clean_working_tree", lambda *_args: (True, ""))
+    monkeypatch.setattr(strategies, "get_default_branch", lambda *_args: "main")
+    monkeypatch.setattr(strategies, "checkout_branch", lambda *_args: (True, ""))
+    hashes = iter(["aaaaaaa", "bbbbbbb"])
+    monkeypatch.setattr(strategies, "generate_hash", lambda: next(hashes))
+
+    make_environment_available(env_path)
+
+    assert not env_path.exists()
+    assert (taken / "other.txt").read_text() == "other"
+    assert (tmp_path / "avail-bbbbbbb" / "work.txt").read_text() == "work"
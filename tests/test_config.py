@@ -7,6 +7,7 @@ from types import SimpleNamespace
 import pytest
 
 from multiclaude import cli as multiclaude
+from multiclaude.config import load_config
 
 
 def test_config_read_existing_value(initialized_repo):
@@ -191,3 +192,16 @@ def test_config_environments_dir_expansion(initialized_repo):
     config = json.loads(config_file.read_text())
     assert config["environments_dir"] == str(Path.home() / "test-environments")
     assert "~" not in config["environments_dir"]
+
+
+def test_load_config_picks_up_external_edits(initialized_repo):
+    """Test that cached config is invalidated when the file changes on disk."""
+    repo_path = initialized_repo.repo_path
+    assert load_config(repo_path).default_agent == "claude"
+
+    config_file = repo_path / ".multiclaude" / "config.json"
+    config = json.loads(config_file.read_text())
+    config["default_agent"] = "other-agent"
+    config_file.write_text(json.dumps(config, indent=2))
+
+    assert load_config(repo_path).default_agent == "other-agent"
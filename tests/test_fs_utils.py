@@ -0,0 +1,55 @@
+"""Tests for filesystem helpers."""
+
+import os
+
+import pytest
+
+from multiclaude.fs_utils import atomic_write_bytes
+
+
+def test_atomic_write_bytes_replaces_contents_and_keeps_mode(tmp_path):
+    """Test that atomic writes keep the file mode and leave no temp files behind."""
+    target = tmp_path / "tasks.json"
+    target.write_bytes(b"old")
+    target.chmod(0o600)
+
+    atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["tasks.json"]
+
+
+def test_atomic_write_bytes_failure_keeps_original(tmp_path, monkeypatch):
+    """Test that a failed write leaves the original file untouched."""
+    target = tmp_path / "tasks.json"
+    target.write_bytes(b"old")
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.fsync", fail_fsync)
+    with pytest.raises(OSError, match="disk full"):
+        atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["tasks.json"]
+
+
+def test_atomic_write_bytes_new_file_honours_umask(tmp_path, monkeypatch):
+    """Test that new files get the mode a plain open() would, without touching the umask."""
+    target = tmp_path / "tasks.json"
+    previous = os.umask(0o077)
+    try:
+        with monkeypatch.context() as m:
+
+            def no_umask(mask):
+                raise AssertionError("the process umask must not be changed")
+
+            m.setattr("os.umask", no_umask)
+            atomic_write_bytes(target, b"new")
+    finally:
+        os.umask(previous)
+
+    assert target.read_bytes() == b"new"
+    assert target.stat().st_mode & 0o777 == 0o600
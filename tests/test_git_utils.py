@@ -3,7 +3,18 @@
 import os
 from pathlib import Path
 
-from multiclaude.git_utils import get_git_root, git
+from multiclaude.git_utils import (
+    GitBatch,
+    check_git_status,
+    check_new_branch,
+    check_unpushed_commits,
+    get_default_branch,
+    get_git_root,
+    git,
+    is_branch_merged,
+    readonly_git_env,
+    setup_branch_from_ref,
+)
 
 
 def test_get_git_root_from_root(tmp_path):
@@ -54,3 +65,136 @@ def test_get_git_root_uses_cwd_by_default(tmp_path):
         assert root == tmp_path
     finally:
         os.chdir(original_cwd)
+
+
+def test_check_new_branch(git_repo):
+    """Test combined branch/base ref preflight check."""
+    git(["branch", "mc-taken"], git_repo, check=True)
+
+    assert check_new_branch(git_repo, "mc-free", "main") == (False, True)
+    assert check_new_branch(git_repo, "mc-free", "nope") == (False, False)
+    assert check_new_branch(git_repo, "mc-taken", "main")[0] is True
+
+
+def test_git_batch_sees_refs_created_during_session(git_repo):
+    """Test that a running GitBatch reflects refs created after it started."""
+    with GitBatch(git_repo) as batch:
+        assert batch.exists("main")
+        assert batch.exists("HEAD")
+        assert not batch.exists("does-not-exist")
+        assert not batch.branch_exists("mc-later")
+
+        git(["branch", "mc-later"], git_repo, check=True)
+        assert batch.branch_exists("mc-later")
+
+
+def test_get_default_branch_from_origin_head(git_repo):
+    """Test default branch detection from refs/remotes/origin/HEAD."""
+    assert get_default_branch(git_repo) == "main"
+
+    git(["update-ref", "refs/remotes/origin/trunk", "HEAD"], git_repo, check=True)
+    git(
+        ["symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/trunk"],
+        git_repo,
+        check=True,
+    )
+    assert get_default_branch(git_repo) == "trunk"
+
+
+def test_is_branch_merged_uses_ancestry(git_repo):
+    """Test merged, unmerged, and unknown branches."""
+    git(["branch", "merged"], git_repo, check=True)
+    git(["checkout", "-b", "ahead"], git_repo, check=True)
+    git(["commit", "--allow-empty", "-m", "work"], git_repo, check=True)
+
+    assert is_branch_merged(git_repo, "merged", "main") == (True, None)
+    assert is_branch_merged(git_repo, "ahead", "main") == (False, "branch not merged into main")
+    is_merged, msg = is_branch_merged(git_repo, "missing", "main")
+    assert not is_merged
+    assert msg is not None and msg.startswith("failed to check merge status")
+
+
+def test_prune_checks_with_readonly_env(git_repo):
+    """Test working tree and unpushed-commit checks run with optional locks disabled."""
+    env = readonly_git_env()
+    assert env["GIT_OPTIONAL_LOCKS"] == "0"
+    assert check_git_status(git_repo, env) == (True, None)
+    assert check_unpushed_commits(git_repo, "main", env) == [
+        "origin remote not configured (cannot verify pushed commits)"
+    ]
+
+    git(["remote", "add", "origin", str(git_repo)], git_repo, check=True)
+    git(["update-ref", "refs/remotes/origin/main", "HEAD"], git_repo, check=True)
+    assert check_unpushed_commits(git_repo, "main", env) == []
+    git(["commit", "--allow-empty", "-m", "local"], git_repo, check=True)
+    assert check_unpushed_commits(git_repo, "main", env) == ["unpushed commits present"]
+    assert check_unpushed_commits(git_repo, "other", env) == [
+        "remote branch origin/other not found (unpushed commits)"
+    ]
+
+    (git_repo / "dirty.txt").write_text("x")
+    assert check_git_status(git_repo, env) == (False, "uncommitted changes present")
+
+
+def test_get_default_branch_from_linked_worktree(git_repo, tmp_path):
+    """Test that origin/HEAD is found through a worktree's .git pointer file."""
+    git(["update-ref", "refs/remotes/origin/trunk", "HEAD"], git_repo, check=True)
+    git(
+        ["symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/trunk"],
+        git_repo,
+        check=True,
+    )
+    worktree = tmp_path / "wt"
+    git(["worktree", "add", str(worktree), "-b", "feature"], git_repo, check=True)
+
+    assert (worktree / ".git").is_file()
+    assert get_default_branch(worktree) == "trunk"
+
+
+def test_setup_branch_from_ref(git_repo):
+    """Test resetting an environment onto a new branch and reporting a bad base ref."""
+    (git_repo / "tracked.txt").write_text("v1\n")
+    git(["add", "tracked.txt"], git_repo, check=True)
+    git(["commit", "-m", "add tracked"], git_repo, check=True)
+    (git_repo / "tracked.txt").write_text("dirty\n")
+    (git_repo / "untracked.txt").write_text("x\n")
+
+    assert setup_branch_from_ref(git_repo, "mc-next", "main") == (True, "")
+    assert git(["branch", "--show-current"], git_repo)[1] == "mc-next"
+    assert (git_repo / "tracked.txt").read_text() == "v1\n"
+    assert not (git_repo / "untracked.txt").exists()
+
+    success, error = setup_branch_from_ref(git_repo, "mc-other", "missing-ref")
+    assert not success
+    assert error.startswith("Failed to checkout base ref 'missing-ref': ")
+    assert git(["branch", "--list", "mc-other"], git_repo)[1] == ""
+
+
+def test_get_git_root_without_spawning_git(git_repo, tmp_path, monkeypatch):
+    """Test that repository roots, including linked worktrees, are found on disk."""
+    worktree = tmp_path / "wt"
+    git(["worktree", "add", str(worktree), "-b", "feature"], git_repo, check=True)
+    (worktree / "nested").mkdir()
+
+    def no_git(*args, **kwargs):
+        raise AssertionError("git should not be spawned")
+
+    monkeypatch.setattr("multiclaude.git_utils.git", no_git)
+    assert get_git_root(git_repo) == git_repo
+    assert get_git_root(worktree / "nested") == worktree
+
+
+def test_get_git_root_defers_to_git_for_foreign_repos(git_repo, monkeypatch):
+    """Test that repositories owned by another user go through git's ownership check."""
+    calls = []
+
+    def fake_git(cmd, cwd, check=False, env=None):
+        calls.append(cmd)
+        return 128, "", "fatal: detected dubious ownership in repository"
+
+    other_uid = os.getuid() + 1
+    monkeypatch.setattr("multiclaude.git_utils.os.getuid", lambda: other_uid)
+    monkeypatch.setattr("multiclaude.git_utils.git", fake_git)
+
+    assert get_git_root(git_repo) is None
+    assert calls == [["rev-parse", "--show-toplevel"]]
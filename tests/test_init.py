@@ -3,6 +3,8 @@
 import json
 from types import SimpleNamespace
 
+import pytest
+
 from multiclaude import cli as multiclaude
 from multiclaude.git_utils import git
 
@@ -128,3 +130,28 @@ def test_init_from_subdirectory(tmp_path, monkeypatch):
     # Test list command from subdirectory
     args = SimpleNamespace(show_pruned=False, quiet=False)
     multiclaude.cmd_list(args)  # Should not raise NotInitializedError
+
+
+def test_init_in_linked_worktree(git_repo, tmp_path, monkeypatch):
+    """Test that init works where .git is a pointer file rather than a directory."""
+    worktree = tmp_path / "wt"
+    git(["worktree", "add", str(worktree), "-b", "feature"], git_repo, check=True)
+    assert (worktree / ".git").is_file()
+    monkeypatch.chdir(worktree)
+
+    multiclaude.cmd_init(SimpleNamespace(environments_dir=tmp_path / "test-environments"))
+
+    assert (worktree / ".multiclaude" / "config.json").exists()
+
+
+def test_version_prints_to_stdout(monkeypatch, capsys):
+    """Test that --version writes to stdout so it can be piped."""
+    monkeypatch.setattr("sys.argv", ["multiclaude", "--version"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        multiclaude.main()
+
+    assert exc_info.value.code == 0
+    captured = capsys.readouterr()
+    assert captured.out == f"multiclaude {multiclaude.get_version()}\n"
+    assert captured.err == ""
@@ -5,6 +5,7 @@ from pathlib import Path
 from types import SimpleNamespace
 
 from multiclaude import cli as multiclaude
+from multiclaude import tasks as tasks_module
 from multiclaude.git_utils import git
 from tests.conftest import configure_git_repo
 
@@ -213,3 +214,51 @@ def test_prune_dry_run_does_not_change_state(initialized_repo, capsys):
     assert updated_task["status"] == "active"
     assert updated_task["pruned_at"] is None
     assert env_path.exists()
+
+
+def test_prune_reports_tasks_in_order(initialized_repo, capsys):
+    """Concurrent evaluation should still report tasks in stored order."""
+    names = ["alpha", "bravo", "charlie", "delta"]
+    for name in names:
+        args_new = SimpleNamespace(branch_name=name, no_launch=True, base="main", agent=None)
+        multiclaude.cmd_new(args_new)
+
+    tasks = _read_tasks(initialized_repo.repo_path)
+    tasks[1]["status"] = "pruned"
+    (initialized_repo.repo_path / ".multiclaude" / "tasks.json").write_text(json.dumps(tasks))
+    capsys.readouterr()
+
+    args_prune = SimpleNamespace(task_name=None, force=False, dry_run=False, yes=True)
+    multiclaude.cmd_prune(args_prune)
+
+    skipped = [
+        line.split(":")[0].removeprefix("Skipping ")
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith("Skipping")
+    ]
+    assert skipped == [f"mc-{name}" for name in names]
+
+
+def test_prune_worktree_strategy_fetches_once(initialized_repo, monkeypatch, capsys):
+    """Worktree tasks share the main repo's refs, so prune fetches there only once."""
+    multiclaude.cmd_config(SimpleNamespace(path="environment_strategy", write="worktree"))
+    for name in ["alpha", "bravo", "charlie"]:
+        args_new = SimpleNamespace(branch_name=name, no_launch=True, base="main", agent=None)
+        multiclaude.cmd_new(args_new)
+    capsys.readouterr()
+
+    fetched: list[Path] = []
+    monkeypatch.setattr(multiclaude, "fetch_all_safe", lambda path: fetched.append(path) or True)
+    task_git_calls: list[list[str]] = []
+    real_git_quiet = tasks_module.git_quiet
+    monkeypatch.setattr(
+        tasks_module,
+        "git_quiet",
+        lambda cmd, cwd: task_git_calls.append(cmd) or real_git_quiet(cmd, cwd),
+    )
+
+    args_prune = SimpleNamespace(task_name=None, force=False, dry_run=True, yes=True)
+    multiclaude.cmd_prune(args_prune)
+
+    assert fetched == [initialized_repo.repo_path.resolve()]
+    assert not [cmd for cmd in task_git_calls if cmd[0] == "fetch"]
@@ -0,0 +1,159 @@
+"""Tests for task metadata storage."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+from multiclaude.config import load_config
+from multiclaude.tasks import (
+    Task,
+    create_task,
+    index_tasks,
+    load_tasks,
+    mark_tasks_pruned,
+    match_tasks,
+    save_tasks,
+)
+
+
+def test_create_task_recovers_from_missing_file(initialized_repo):
+    """Test that create_task falls back to a full write when tasks.json is missing."""
+    config = load_config(initialized_repo.repo_path)
+    tasks_file = initialized_repo.repo_path / ".multiclaude" / "tasks.json"
+    tasks_file.unlink()
+
+    task = create_task(config, "mc-solo", initialized_repo.environments_dir / "mc-solo", "claude")
+
+    assert [Task(**data) for data in json.loads(tasks_file.read_text())] == [task]
+
+
+def test_task_to_dict_matches_fields():
+    """Test that Task.to_dict covers every dataclass field."""
+    task = Task(
+        id="mc-x",
+        branch="mc-x",
+        created_at="2024-01-01T00:00:00",
+        status="active",
+        environment_path="/environments/mc-x",
+        agent="claude",
+    )
+    assert task.to_dict() == asdict(task)
+
+
+def test_match_tasks_uses_branch_and_id_in_stored_order():
+    """Test index-based task matching on branch and id."""
+    tasks = [
+        Task("mc-a", "mc-a", "2024-01-01T00:00:00", "pruned", "/environments/mc-a", "claude"),
+        Task("legacy", "mc-b", "2024-01-01T00:00:00", "active", "/environments/mc-b", "claude"),
+        Task("mc-a", "mc-a", "2024-01-02T00:00:00", "active", "/environments/mc-a", "claude"),
+    ]
+    index = index_tasks(tasks)
+
+    assert match_tasks(tasks, index, {"a", "mc-a"}) == [tasks[0], tasks[2]]
+    assert match_tasks(tasks, index, {"legacy"}) == [tasks[1]]
+    assert match_tasks(tasks, index, {"mc-b"}) == [tasks[1]]
+    assert match_tasks(tasks, index, {"missing"}) == []
+
+
+def _create_tasks(repo_path: Path, names: list[str]) -> None:
+    config = load_config(repo_path)
+    for name in names:
+        create_task(config, name, config.environments_dir / name, "claude")
+
+
+def test_concurrent_create_task_keeps_every_task(initialized_repo):
+    """Test that parallel create_task processes do not lose or corrupt entries."""
+    config = load_config(initialized_repo.repo_path)
+    batches = [[f"mc-{worker}-{n}" for n in range(10)] for worker in range(6)]
+
+    with ProcessPoolExecutor(max_workers=6) as executor:
+        list(executor.map(_create_tasks, [config.repo_root] * len(batches), batches))
+
+    names = [name for batch in batches for name in batch]
+
+    assert sorted(task.branch for task in load_tasks(config)) == sorted(names)
+
+
+def test_load_tasks_picks_up_external_edits(initialized_repo):
+    """Test that cached task data is invalidated when tasks.json changes on disk."""
+    config = load_config(initialized_repo.repo_path)
+    create_task(config, "mc-one", initialized_repo.environments_dir / "mc-one", "claude")
+    first = load_tasks(config)
+    first[0].status = "missing"
+    assert load_tasks(config)[0].status == "active"
+
+    tasks_file = initialized_repo.repo_path / ".multiclaude" / "tasks.json"
+    data = json.loads(tasks_file.read_text())
+    data[0]["status"] = "pruned"
+    tasks_file.write_text(json.dumps(data))
+    assert load_tasks(config)[0].status == "pruned"
+
+
+def test_tasks_file_is_written_compactly(initialized_repo):
+    """Test that tasks.json is stored without indentation."""
+    config = load_config(initialized_repo.repo_path)
+    create_task(config, "mc-one", initialized_repo.environments_dir / "mc-one", "claude")
+    save_tasks(config, load_tasks(config))
+
+    contents = (initialized_repo.repo_path / ".multiclaude" / "tasks.json").read_text()
+    assert "\n" not in contents
+    assert json.loads(contents)[0]["branch"] == "mc-one"
+
+
+def test_create_task_on_empty_file(initialized_repo):
+    """Test that an empty tasks.json is treated as having no tasks."""
+    config = load_config(initialized_repo.repo_path)
+    tasks_file = initialized_repo.repo_path / ".multiclaude" / "tasks.json"
+    tasks_file.write_bytes(b"")
+    assert load_tasks(config) == []
+
+    create_task(config, "mc-one", initialized_repo.environments_dir / "mc-one", "claude")
+    assert [task.branch for task in load_tasks(config)] == ["mc-one"]
+
+
+def test_save_tasks_skips_unchanged_content(initialized_repo):
+    """Test that saving identical tasks leaves the file untouched."""
+    config = load_config(initialized_repo.repo_path)
+    tasks_file = initialized_repo.repo_path / ".multiclaude" / "tasks.json"
+    create_task(config, "mc-one", initialized_repo.environments_dir / "mc-one", "claude")
+    inode = tasks_file.stat().st_ino
+
+    tasks = load_tasks(config)
+    save_tasks(config, tasks)
+    assert tasks_file.stat().st_ino == inode
+
+    tasks[0].status = "pruned"
+    save_tasks(config, tasks)
+    assert tasks_file.stat().st_ino != inode
+    assert load_tasks(config)[0].status == "pruned"
+
+
+def test_mark_tasks_pruned_keeps_concurrently_created_tasks(initialized_repo):
+    """Test that pruning updates the current file rather than a stale task list."""
+    config = load_config(initialized_repo.repo_path)
+    create_task(config, "mc-old", initialized_repo.environments_dir / "mc-old", "claude")
+    stale = load_tasks(config)
+
+    create_task(config, "mc-new", initialized_repo.environments_dir / "mc-new", "claude")
+    mark_tasks_pruned(config, {task.id for task in stale}, "2024-01-01T00:00:00")
+
+    tasks = load_tasks(config)
+    assert [(task.branch, task.status) for task in tasks] == [
+        ("mc-old", "pruned"),
+        ("mc-new", "active"),
+    ]
+    assert tasks[0].pruned_at == "2024-01-01T00:00:00"
+
+
+def test_create_task_replaces_file_atomically(initialized_repo):
+    """Test that appending a task swaps in a new file instead of editing it in place."""
+    config = load_config(initialized_repo.repo_path)
+    tasks_file = initialized_repo.repo_path / ".multiclaude" / "tasks.json"
+    create_task(config, "mc-one", initialized_repo.environments_dir / "mc-one", "claude")
+    inode = tasks_file.stat().st_ino
+
+    create_task(config, "mc-two", initialized_repo.environments_dir / "mc-two", "claude")
+
+    assert tasks_file.stat().st_ino != inode
+    assert [task.branch for task in load_tasks(config)] == ["mc-one", "mc-two"]
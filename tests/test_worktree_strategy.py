@@ -0,0 +1,67 @@
+"""Test WorktreeStrategy implementation details."""
+
+from pathlib import Path
+
+import pytest
+
+from multiclaude.config import Config
+from multiclaude.errors import MultiClaudeError
+from multiclaude.git_utils import git
+from multiclaude.strategies import WorktreeStrategy
+
+
+def create_worktree_strategy(repo_root: Path, base_dir: Path) -> WorktreeStrategy:
+    """Create a WorktreeStrategy for the given repo and environments dir."""
+    config = Config(
+        version="1.0.0",
+        repo_root=repo_root,
+        default_branch="main",
+        created_at="2024-01-01",
+        environment_strategy="worktree",
+        default_agent="claude",
+        environments_dir=base_dir,
+    )
+    return WorktreeStrategy(config)
+
+
+def test_worktree_strategy_creates_branch(isolated_git_repo, tmp_path):
+    """Test that create adds a worktree on a new branch."""
+    strategy = create_worktree_strategy(isolated_git_repo, tmp_path / "envs")
+
+    path, was_reused = strategy.create(isolated_git_repo, "mc-feature", "main")
+
+    assert not was_reused
+    assert path == tmp_path / "envs" / isolated_git_repo.name / "mc-feature"
+    assert git(["branch", "--show-current"], path)[1] == "mc-feature"
+
+
+def test_worktree_strategy_reports_missing_base_ref(isolated_git_repo, tmp_path):
+    """Test that an invalid base ref maps to a friendly error."""
+    strategy = create_worktree_strategy(isolated_git_repo, tmp_path / "envs")
+
+    with pytest.raises(MultiClaudeError, match="Base ref 'nope' does not exist"):
+        strategy.create(isolated_git_repo, "mc-feature", "nope")
+
+
+def test_worktree_strategy_reports_existing_branch(isolated_git_repo, tmp_path):
+    """Test that an existing branch maps to a friendly error."""
+    strategy = create_worktree_strategy(isolated_git_repo, tmp_path / "envs")
+    git(["branch", "mc-feature"], isolated_git_repo, check=True)
+
+    with pytest.raises(MultiClaudeError, match="Branch 'mc-feature' already exists"):
+        strategy.create(isolated_git_repo, "mc-feature", "main")
+
+
+def test_worktree_strategy_maps_errors_under_translated_locale(
+    isolated_git_repo, tmp_path, monkeypatch
+):
+    """Test that error mapping does not depend on the user's message language."""
+    strategy = create_worktree_strategy(isolated_git_repo, tmp_path / "envs")
+    git(["branch", "mc-feature"], isolated_git_repo, check=True)
+    monkeypatch.setenv("LANGUAGE", "de")
+    monkeypatch.setenv("LC_ALL", "C.UTF-8")
+
+    with pytest.raises(MultiClaudeError, match="Branch 'mc-feature' already exists"):
+        strategy.create(isolated_git_repo, "mc-feature", "main")
+    with pytest.raises(MultiClaudeError, match="Base ref 'nope' does not exist"):
+        strategy.create(isolated_git_repo, "mc-other", "nope")